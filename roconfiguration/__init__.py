@@ -1,11 +1,36 @@
 import configparser
+import copy
 import json
+import operator
 import os
+import sys
 from collections import abc
-from typing import Any, Dict, Mapping, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
 
 import yaml
 
+try:
+    from yaml import CFullLoader as _FullLoader
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    # PyYAML was built without LibYAML bindings
+    from yaml import FullLoader as _FullLoader  # type: ignore
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
+try:
+    import orjson as _json
+except ImportError:
+    _json = json  # type: ignore
+
+# orjson does not handle integers out of the 64-bit range like the
+# built-in json module: documents containing 19 digits in a row are parsed with
+# the built-in json module; mapping digits to "0" and anything else to " " with
+# bytes.translate is several times faster than searching them with a regex
+_DIGITS_TABLE = bytes(b"0"[0] if 48 <= i <= 57 else b" "[0] for i in range(256))
+_LONG_NUMBER = b"0" * 19
+
 __all__ = ["Configuration", "ConfigurationError", "ConfigurationOverrideError"]
 
 
@@ -17,82 +42,393 @@ class ConfigurationOverrideError(ConfigurationError):
     """An exception risen for invalid configuration override."""
 
 
-def apply_key_value(obj, key, value):
+_MISSING = object()
+
+# types of values that never need to be wrapped, handled without isinstance checks
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _has_containers(items: Sequence[Any]) -> bool:
+    for item in items:
+        if type(item) not in _SCALAR_TYPES and _is_container(item):
+            return True
+    return False
+
+
+def _wrap(value: Any) -> Any:
+    if _is_mutable_sequence(value):
+        if _has_containers(value):
+            return _ConfigurationList(value)
+        # sequences of scalars need no wrapping: a new list is returned, which
+        # can be used like any list without modifying the configuration
+        return list(value)
+    if _is_container(value):
+        return Configuration(value)
+    return value
+
+
+def _freeze_value(value: Any) -> Any:
+    if _is_mutable_sequence(value):
+        if _has_containers(value):
+            return _ConfigurationList(value).freeze()
+        return list(value)
+    if _is_container(value):
+        return Configuration(value).freeze()
+    return value
+
+
+def _is_mutable_sequence(value: Any) -> bool:
+    value_type = type(value)
+    if value_type is list:
+        return True
+    if value_type is dict:
+        return False
+    return isinstance(value, abc.MutableSequence)
+
+
+def _is_container(value: Any) -> bool:
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        return True
+    return isinstance(value, (abc.Mapping, abc.MutableSequence))
+
+
+def _to_index(part: str) -> Optional[int]:
+    try:
+        return int(part)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=2048)
+def _split_key(key: str) -> Tuple[str, Tuple[Tuple[str, Optional[int]], ...]]:
+    """
+    Splits a key into its parts, each returned with its value as list index, or
+    None if it is not numeric.
+    """
     key = key.strip("_:")  # remove special characters from both ends
-    for token in (":", "__"):
-        if token in key:
-            parts = key.split(token)
-
-            sub_property = obj
-            last_part = parts[-1]
-            for part in parts[:-1]:
-
-                if isinstance(sub_property, abc.MutableSequence):
-                    try:
-                        index = int(part)
-                    except ValueError:
-                        raise ConfigurationOverrideError(
-                            f"{part} was supposed to be a numeric index in {key}"
-                        )
-
-                    sub_property = sub_property[index]
-                    continue
-
-                try:
-                    sub_property = sub_property[part]
-                except KeyError:
-                    sub_property[part] = {}
-                    sub_property = sub_property[part]
-                else:
-                    if not isinstance(sub_property, abc.Mapping) and not isinstance(
-                        sub_property, abc.MutableSequence
-                    ):
-                        raise ConfigurationOverrideError(
-                            f"The key `{key}` cannot be used "
-                            f"because it overrides another "
-                            f"variable with shorter key! ({part}, {sub_property})"
-                        )
-
-            if isinstance(sub_property, abc.MutableSequence):
-                try:
-                    index = int(last_part)
-                except ValueError:
-                    raise ConfigurationOverrideError(
-                        f"{last_part} was supposed to be a numeric index in {key}, "
-                        f"because the affected property is a mutable sequence."
-                    )
+    # both "__" and ":" separate parts: replacing "__" with ":" before splitting
+    # gives the same parts as splitting by the pattern "__|:", without using re;
+    # parts are interned, since they are used as keys of dictionaries
+    return key, tuple(
+        (sys.intern(part), _to_index(part))
+        for part in key.replace("__", ":").split(":")
+    )
+
+
+def _copy_container(value: Any) -> Any:
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        return value.copy()
+    try:
+        value_copy = copy.copy(value)
+    except (TypeError, copy.Error):
+        # for example MappingProxyType, which cannot be copied
+        pass
+    else:
+        if isinstance(value_copy, (abc.MutableMapping, abc.MutableSequence)):
+            return value_copy
+    # read-only mappings are copied to dictionaries, so they can be modified
+    return dict(value) if isinstance(value, abc.Mapping) else list(value)
+
+
+def _disown(owned, value) -> None:
+    """
+    Removes an object replaced by a new value from the given dictionary of owned
+    objects, together with its owned descendants, so that no references to it are
+    kept.
+    """
+    if owned.pop(id(value), None) is not None:
+        # owned objects are only found inside other owned objects
+        children = value.values() if isinstance(value, abc.Mapping) else value
+        for child in children:
+            _disown(owned, child)
 
-                try:
-                    sub_property[index] = value
-                except IndexError:
-                    raise ConfigurationOverrideError(
-                        f"Invalid override for mutable sequence {key}; "
-                        f"assignment index out of range"
-                    )
-            else:
-                try:
-                    sub_property[last_part] = value
-                except TypeError as te:
-                    raise ConfigurationOverrideError(
-                        f"Invalid assignment {key} -> {value}; {str(te)}"
-                    )
 
+def apply_key_value(obj, key, value, owned=None):
+    """
+    Sets a value in the given object, by key. The key can contain paths to
+    nested objects and list indices, separated by ":" or "__".
+
+    :param obj: object to be modified
+    :param key: key of the value to set
+    :param value: the value to set
+    :param owned: optional dictionary of nested objects created or copied by the
+    caller, by id; when given, other nested objects are copied before being
+    modified, and objects replaced by new values are removed from it
+    """
+    key, parts = _split_key(key)
+
+    if len(parts) == 1:
+        if owned:
+            _disown(owned, obj.get(parts[0][0]))
+        obj[parts[0][0]] = value
+        return obj
+
+    return _apply_key_parts(obj, key, parts, value, owned)
+
+
+def _apply_key_parts(obj, key, parts, value, owned=None):
+    if len(parts) == 2:
+        # fast path for the most common case of keys with a single level of
+        # nesting inside a dictionary, already copied by a previous override:
+        # a single lookup, no type checks on values
+        sub_property = obj.get(parts[0][0]) if type(obj) is dict else None
+        if type(sub_property) is dict and (
+            owned is None or owned.get(id(sub_property)) is sub_property
+        ):
+            if owned:
+                _disown(owned, sub_property.get(parts[1][0]))
+            sub_property[parts[1][0]] = value
             return obj
 
-    obj[key] = value
+    sub_property = obj
+    get_sub_property = _get_sub_property
+    for part in parts[:-1]:
+        sub_property = get_sub_property(sub_property, key, part, owned)
+
+    _set_sub_property(sub_property, key, parts[-1], value, owned)
     return obj
 
 
-def _develop_configparser_values(parser):
-    values = {}
-    for section_name in parser.sections():
-        section_values = {}
-        for k, v in parser[section_name].items():
-            section_values[k] = (
-                _develop_configparser_values(v) if isinstance(v, abc.Mapping) else v
+def _apply_nested_keys(obj, entries, owned=None):
+    """
+    Applies many nested keys to the given object, sorting them by their parts so
+    that keys sharing the same parents are applied one after the other, reusing
+    the objects already reached for the previous key. Longer keys are applied
+    before shorter keys with the same beginning, so that shorter keys override
+    them instead of conflicting with them.
+
+    :param obj: object to be modified
+    :param entries: list of tuples of parts (as returned by _split_key), key and
+    value
+    :param owned: optional dictionary of nested objects owned by the caller, see
+    apply_key_value
+    """
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+
+    previous_parents: Tuple[Tuple[str, Optional[int]], ...] = ()
+    sub_properties = [obj]  # objects reached walking the previous parents
+
+    # local names, to avoid looking up globals and methods inside the loop
+    get_sub_property = _get_sub_property
+    set_sub_property = _set_sub_property
+    append = sub_properties.append
+
+    for parts, key, value in entries:
+        parents = parts[:-1]
+        common = 0
+        limit = min(len(parents), len(previous_parents))
+        while common < limit and parents[common] == previous_parents[common]:
+            common += 1
+
+        del sub_properties[common + 1 :]
+        for part in parents[common:]:
+            append(get_sub_property(sub_properties[-1], key, part, owned))
+
+        set_sub_property(sub_properties[-1], key, parts[-1], value, owned)
+        previous_parents = parents
+
+    return obj
+
+
+def _get_sub_property(sub_property, key, key_part, owned=None):
+    part, index = key_part
+    # exact type checks first, avoiding function calls and isinstance checks for
+    # the common dict and list cases
+    sub_property_type = type(sub_property)
+    if sub_property_type is list or (
+        sub_property_type is not dict and _is_mutable_sequence(sub_property)
+    ):
+        if index is None:
+            raise ConfigurationOverrideError(
+                f"{part} was supposed to be a numeric index in {key}"
             )
-        values[section_name] = section_values
-    return values
+
+        position: Any = index
+        child = sub_property[index]
+    else:
+        # existing objects are the common case: avoid creating a dictionary
+        # for dict.setdefault when it is not needed
+        try:
+            child = sub_property[part]
+        except KeyError:
+            sub_property[part] = child = {}
+            if owned is not None:
+                owned[id(child)] = child
+            return child
+        position = part
+
+    child_type = type(child)
+    if child_type is not dict and child_type is not list and not _is_container(child):
+        raise ConfigurationOverrideError(
+            f"The key `{key}` cannot be used "
+            f"because it overrides another "
+            f"variable with shorter key! ({part}, {child})"
+        )
+
+    if owned is not None and owned.get(id(child)) is not child:
+        # copy on write: the object might be shared with other mappings
+        sub_property[position] = child = _copy_container(child)
+        owned[id(child)] = child
+    return child
+
+
+def _set_sub_property(sub_property, key, key_part, value, owned=None):
+    last_part, index = key_part
+    sub_property_type = type(sub_property)
+    if sub_property_type is list or (
+        sub_property_type is not dict and _is_mutable_sequence(sub_property)
+    ):
+        if index is None:
+            raise ConfigurationOverrideError(
+                f"{last_part} was supposed to be a numeric index in {key}, "
+                f"because the affected property is a mutable sequence."
+            )
+
+        try:
+            if owned:
+                _disown(owned, sub_property[index])
+            sub_property[index] = value
+        except IndexError:
+            raise ConfigurationOverrideError(
+                f"Invalid override for mutable sequence {key}; "
+                f"assignment index out of range"
+            )
+    else:
+        if owned:
+            _disown(owned, sub_property.get(last_part))
+        try:
+            sub_property[last_part] = value
+        except TypeError as te:
+            raise ConfigurationOverrideError(
+                f"Invalid assignment {key} -> {value}; {str(te)}"
+            )
+
+
+def _develop_configparser_values(parser):
+    # values of sections are always strings, since ConfigParser does not support
+    # nested sections; ConfigParser.items handles the DEFAULT section and
+    # interpolation for all options of a section at once, unlike SectionProxy
+    return {
+        section_name: dict(parser.items(section_name))
+        for section_name in parser.sections()
+    }
+
+
+def _load_ini(file_path: str) -> Dict[str, Any]:
+    with open(file_path, "rb") as f:
+        ini_settings = f.read().decode("utf-8")
+    parser = configparser.ConfigParser()
+    parser.read_string(ini_settings, source=file_path)
+    return _develop_configparser_values(parser)
+
+
+def _parse_json(data: bytes) -> Any:
+    if _json is not json and _LONG_NUMBER not in data.translate(_DIGITS_TABLE):
+        try:
+            return _json.loads(data)
+        except ValueError:
+            # for example NaN and Infinity, accepted by the built-in json module;
+            # orjson is as strict as the built-in json module, so invalid
+            # documents raise the same error whatever module is installed
+            pass
+    return json.loads(data)
+
+
+def _load_json(file_path: str) -> Any:
+    # both orjson and the built-in json module parse bytes directly
+    with open(file_path, "rb") as f:
+        return _parse_json(f.read())
+
+
+def _load_yaml(file_path: str, safe_load: bool) -> Any:
+    # the file is read in binary mode, to let the parser handle its encoding
+    with open(file_path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader if safe_load else _FullLoader)
+
+
+# Parsed files are cached by absolute path, modification time and size, so that
+# a file is parsed again only when it changes on disk. Callers receive deep
+# copies, since the cached objects must never be modified.
+# Deep copies pay off only for formats slow to parse: for a file of 500 entries,
+# copy.deepcopy takes ~1.4ms, against ~14ms to parse yaml with LibYAML and ~7ms to
+# parse ini, but only ~0.2ms (orjson) or ~0.35ms (json) to parse json. For this
+# reason, json files are cached only on demand.
+@lru_cache(maxsize=128)
+def _load_ini_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    return _load_ini(file_path)
+
+
+@lru_cache(maxsize=128)
+def _load_json_cached(file_path: str, mtime_ns: int, size: int) -> Any:
+    return _load_json(file_path)
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(file_path: str, mtime_ns: int, size: int, safe_load: bool) -> Any:
+    return _load_yaml(file_path, safe_load)
+
+
+class _ConfigurationList(abc.Sequence):
+    """
+    A read-only façade for sequences inside configuration objects, wrapping their
+    items only when they are accessed.
+    """
+
+    __slots__ = ("__items", "__children")
+
+    def __init__(self, items: Sequence[Any]):
+        self.__items = items
+        self.__children: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            return [self[i] for i in range(*index.indices(len(self.__items)))]
+        if type(index) is not int:
+            try:
+                index = operator.index(index)
+            except TypeError:
+                raise TypeError(
+                    "list indices must be integers or slices, "
+                    f"not {type(index).__name__}"
+                ) from None
+        if index < 0:
+            index += len(self.__items)
+        try:
+            child = self.__children[index]
+        except KeyError:
+            pass
+        else:
+            # lists are cached only once frozen, see Configuration.__getattr__
+            return child.copy() if type(child) is list else child
+        if index < 0:
+            raise IndexError("list index out of range")
+        child = _wrap(self.__items[index])
+        child_type = type(child)
+        if child_type is Configuration:
+            self.__children[index] = child
+            child._set_cache_entry(self.__children, index)
+        elif child_type is _ConfigurationList:
+            self.__children[index] = child
+        return child
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, tuple, _ConfigurationList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self.__items)
+
+    def freeze(self) -> "_ConfigurationList":
+        self.__children = {
+            index: _freeze_value(item) for index, item in enumerate(self.__items)
+        }
+        return self
 
 
 class Configuration:
@@ -104,21 +440,23 @@ class Configuration:
     example of JSON structure explorer.
     """
 
-    __slots__ = ("__data",)
-
-    def __new__(cls, arg=None):
-        if not arg:
-            return super().__new__(cls)
-        if isinstance(arg, abc.Mapping):
-            return super().__new__(cls)
-        if isinstance(arg, abc.MutableSequence):
-            return [cls(item) for item in arg]
-        return arg
+    __slots__ = ("__data", "__children", "__frozen", "__cache_entry", "__owned")
 
     def __init__(
         self, mapping: Optional[Mapping[str, Any]] = None
     ):
         self.__data: Dict[str, Any] = {}
+        # wrappers of nested objects, reused until this configuration is modified
+        self.__children: Dict[str, Any] = {}
+        self.__frozen = False
+        self.__cache_entry: Optional[Tuple[Dict[Any, Any], Any]] = None
+        # nested objects created or copied by this configuration, by id: they are
+        # not shared with other objects, so they can be modified without copies
+        self.__owned: Dict[int, Any] = {}
+        if mapping is not None and not isinstance(mapping, abc.Mapping):
+            raise TypeError(
+                f"Configuration requires a mapping, not {type(mapping).__name__}"
+            )
         if mapping:
             self.add_map(mapping)
 
@@ -126,32 +464,87 @@ class Configuration:
         return item in self.__data
 
     def __getitem__(self, name):
-        value = self.__getattr__(name)
-        if value is None:
+        value = self.__getattr__(name, _MISSING)
+        if value is _MISSING:
             raise KeyError(name)
         return value
 
     def __getattr__(self, name, default=None) -> Any:
-        if name in self.__data:
-            value = self.__data.get(name)
-            if isinstance(value, abc.Mapping) or isinstance(value, abc.MutableSequence):
-                return Configuration(value)  # type: ignore
+        # lookups use a sentinel rather than KeyError: misses are common, since
+        # only wrappers of nested objects are cached
+        child = self.__children.get(name, _MISSING)
+        if child is not _MISSING:
+            # lists of scalars are cached only by frozen configurations, which
+            # return copies of them so they cannot be modified
+            return child.copy() if type(child) is list else child
+        value = self.__data.get(name, _MISSING)
+        if value is _MISSING:
+            return default
+        if type(value) in _SCALAR_TYPES:
             return value
-        return default
+        child = _wrap(value)
+        child_type = type(child)
+        if child_type is Configuration:
+            self.__children[name] = child
+            child._set_cache_entry(self.__children, name)
+        elif child_type is _ConfigurationList:
+            self.__children[name] = child
+        else:
+            return child
+        # the wrapper shares the nested objects of this configuration
+        self.__owned.clear()
+        return child
+
+    def __before_change(self) -> None:
+        if self.__frozen:
+            raise ConfigurationError("A frozen configuration cannot be modified.")
+        self.__children.clear()
+
+        if self.__cache_entry is not None:
+            # this configuration wraps a nested object: once modified, it does not
+            # represent anymore the value of its parent, which must not reuse it
+            cache, key = self.__cache_entry
+            if cache.get(key) is self:
+                del cache[key]
+            self.__cache_entry = None
+
+    def _set_cache_entry(self, cache: Dict[Any, Any], key: Any) -> None:
+        self.__cache_entry = (cache, key)
 
     def __repr__(self) -> str:
-        return repr(self.values)
+        # not using values, which gives up the ownership of nested objects
+        return repr(self.__data)
 
     @property
     def values(self) -> Dict[str, Any]:
         """
-        Returns a copy of the dictionary of current settings.
+        Returns a copy of the dictionary of current settings. Nested objects are
+        not copied: they must not be modified, since wrappers of nested objects
+        are reused until the configuration itself is modified.
         """
+        # the copy shares the nested objects of this configuration
+        self.__owned.clear()
         return self.__data.copy()
 
     def to_dict(self):
         return self.values
 
+    def freeze(self) -> "Configuration":
+        """
+        Makes this configuration read-only, wrapping once all nested objects, so
+        that reading values does not require any more work. Any following attempt
+        to modify the configuration raises ConfigurationError.
+
+        :return: this configuration
+        """
+        if not self.__frozen:
+            self.__children = MappingProxyType(  # type: ignore
+                {key: _freeze_value(value) for key, value in self.__data.items()}
+            )
+            self.__frozen = True
+            self.__owned.clear()
+        return self
+
     def add_value(self, name: str, value: Any):
         """
         Adds a configuration value by name. The name can contain
@@ -160,7 +553,10 @@ class Configuration:
         :param name: name of property to set
         :param value: the value to set
         """
-        apply_key_value(self.__data, name, value)
+        self.__before_change()
+        # nested objects can be shared with the mappings merged in this
+        # configuration: they are copied before being modified, only once
+        apply_key_value(self.__data, name, value, self.__owned)
 
     def add_map(self, value: Mapping[str, Any]):
         """
@@ -169,8 +565,20 @@ class Configuration:
 
         :param value: instance of mapping object
         """
-        for key, value in value.items():
-            self.__data[key] = value
+        self.__before_change()
+        # merged values can replace owned objects: ownership is tracked again
+        # from scratch, rather than looking for the replaced objects
+        self.__owned.clear()
+        # keys are interned, so they match by identity the names of attributes
+        # read in code, which are interned by Python; nested objects are handled
+        # the same way when they are wrapped, since wrappers also use add_map
+        intern = sys.intern
+        self.__data.update(
+            {
+                intern(key) if type(key) is str else key: item
+                for key, item in value.items()
+            }
+        )
 
     def add_environmental_variables(
         self,
@@ -185,15 +593,43 @@ class Configuration:
         :param strip_prefix: whether to strip the prefix when overriding keys
         by matched env variables
         """
+        self.__before_change()
+        data = self.__data
+        environ = os.environ.items()
+
         if prefix:
             prefix = prefix.lower()
-        for k, v in os.environ.items():
-            lk = k.lower()
-            if prefix and not lk.startswith(prefix):
-                continue
-            if prefix and strip_prefix:
-                lk = lk[len(prefix) :]
-            apply_key_value(self.__data, lk, v)
+            prefix_length = len(prefix)
+            start = prefix_length if strip_prefix else 0
+            # compare only the beginning of names, lowering whole names only for
+            # the variables matching the prefix
+            items = [
+                (k.lower()[start:], v)
+                for k, v in environ
+                if k[:prefix_length].lower() == prefix
+            ]
+        else:
+            items = [(k.lower(), v) for k, v in environ]
+
+        flat = {}
+        nested = []
+        for lk, v in items:
+            # same as apply_key_value, scanning keys only once for separators
+            lk, parts = _split_key(lk)
+            if len(parts) == 1:
+                flat[parts[0][0]] = v
+            else:
+                nested.append((parts, lk, v))
+
+        owned = self.__owned
+        if nested:
+            _apply_nested_keys(data, nested, owned)
+        # variables without nesting are applied last, overriding the objects set
+        # by longer variables with the same beginning
+        if owned:
+            for lk in flat:
+                _disown(owned, data.get(lk))
+        data.update(flat)
 
     def add_ini(self, ini_settings: str) -> None:
         """
@@ -208,10 +644,50 @@ class Configuration:
     def _handle_missing_configuration_file(self, file_path: str) -> None:
         raise FileNotFoundError(f"missing configuration file: {file_path}")
 
+    def _add_configuration_file(
+        self,
+        file_path: str,
+        optional: bool,
+        cache_config: bool,
+        load: Callable[..., Any],
+        load_cached: Callable[..., Any],
+        *args: Any,
+    ) -> None:
+        # a missing file is detected by the first system call done on its path,
+        # either to obtain its status for the cache or to open it
+        try:
+            if cache_config:
+                st = os.stat(file_path)
+                data = copy.deepcopy(
+                    load_cached(
+                        os.path.abspath(file_path), st.st_mtime_ns, st.st_size, *args
+                    )
+                )
+            else:
+                data = load(file_path, *args)
+        except FileNotFoundError:
+            pass
+        else:
+            self.add_map(data)
+            return
+
+        if not optional:
+            self._handle_missing_configuration_file(file_path)
+
+    @staticmethod
+    def clear_file_cache() -> None:
+        """
+        Clears the cache of parsed configuration files.
+        """
+        _load_ini_cached.cache_clear()
+        _load_json_cached.cache_clear()
+        _load_yaml_cached.cache_clear()
+
     def add_ini_file(
         self,
         file_path: str,
-        optional: bool = False
+        optional: bool = False,
+        cache_config: bool = True
     ) -> None:
         """
         Reads and parse an ini file, merging its values into an instance of
@@ -219,19 +695,22 @@ class Configuration:
 
         :param file_path: path to an ini file
         :param optional: whether the ini file is optional.
+        :param cache_config: whether to reuse the parsed values of the file, until
+        the file is modified
         """
-        if not os.path.exists(file_path):
-            if optional:
-                return
-            self._handle_missing_configuration_file(file_path)
-        parser = configparser.ConfigParser()
-        parser.read(file_path)
-        self.add_map(_develop_configparser_values(parser))
+        self._add_configuration_file(
+            file_path,
+            optional,
+            cache_config,
+            _load_ini,
+            _load_ini_cached,
+        )
 
     def add_json_file(
         self,
         file_path: str,
-        optional: bool = False
+        optional: bool = False,
+        cache_config: bool = False
     ) -> None:
         """
         Reads and parse an json file, merging its values into an instance of
@@ -239,20 +718,24 @@ class Configuration:
 
         :param file_path: path to an json file
         :param optional: whether the json file is optional.
+        :param cache_config: whether to reuse the parsed values of the file, until
+        the file is modified; disabled by default, since parsing json is faster
+        than copying the cached values
         """
-        if not os.path.exists(file_path):
-            if optional:
-                return
-            self._handle_missing_configuration_file(file_path)
-
-        with open(file_path, "rt", encoding="utf-8") as f:
-            self.add_map(json.load(f))
+        self._add_configuration_file(
+            file_path,
+            optional,
+            cache_config,
+            _load_json,
+            _load_json_cached,
+        )
 
     def add_yaml_file(
         self,
         file_path: str,
         optional: bool = False,
-        safe_load: bool = True
+        safe_load: bool = True,
+        cache_config: bool = True
     ) -> None:
         """
         Reads and parse an yaml file, merging its values into an instance of
@@ -261,17 +744,14 @@ class Configuration:
         :param file_path: path to an yaml file
         :param optional: whether the yaml file is optional.
         :param safe_load: whether to use safe load
+        :param cache_config: whether to reuse the parsed values of the file, until
+        the file is modified
         """
-        if not os.path.exists(file_path):
-            if optional:
-                return
-            self._handle_missing_configuration_file(file_path)
-
-        with open(file_path, "rt", encoding="utf-8") as f:
-
-            if safe_load:
-                data = yaml.safe_load(f)
-            else:
-                data = yaml.full_load(f)
-
-            self.add_map(data)
+        self._add_configuration_file(
+            file_path,
+            optional,
+            cache_config,
+            _load_yaml,
+            _load_yaml_cached,
+            safe_load,
+        )
@@ -0,0 +1,50 @@
+import json
+import os
+
+import pytest
+import yaml
+
+from .utils import get_file_path
+
+# Parsed example files are shared by all tests of a session (of each worker,
+# when tests run in parallel): tests must not modify them, and deep copy them
+# when they need to.
+
+
+def _read_yaml_example(file_name: str):
+    with open(get_file_path(file_name), "rb") as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture(scope="session")
+def yaml01_data():
+    return _read_yaml_example("yaml_example_01.yaml")
+
+
+@pytest.fixture(scope="session")
+def yaml02_data():
+    return _read_yaml_example("yaml_example_02.yaml")
+
+
+@pytest.fixture(scope="session")
+def json01_data():
+    with open(get_file_path("json_example_01.json"), "rb") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def ini01_data():
+    # literal values, not parsed with configparser like roconfiguration does
+    return {
+        "a": {"port": "8080", "something": "hello"},
+        "b": {"port": "50022", "something": "world"},
+    }
+
+
+@pytest.fixture(scope="session")
+def missing_file_name():
+    """Returns the name, without extension, of configuration files not existing."""
+    file_name = "__roconfiguration_missing_file__"
+    for extension in (".ini", ".json", ".yaml"):
+        assert not os.path.exists(file_name + extension)
+    return file_name
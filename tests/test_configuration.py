@@ -1,12 +1,24 @@
+import copy
+import json
+import math
 import os
+import sys
+from collections import OrderedDict, UserList
 from textwrap import dedent
-from uuid import uuid4
+from types import MappingProxyType
 
-import pkg_resources
 import pytest
+import yaml
 from pytest import raises
 
-from roconfiguration import Configuration, ConfigurationOverrideError
+import roconfiguration
+from roconfiguration import (
+    Configuration,
+    ConfigurationError,
+    ConfigurationOverrideError,
+)
+
+from .utils import get_file_path
 
 
 class TestConfiguration:
@@ -15,6 +27,11 @@ class TestConfiguration:
 
         assert config is not None
 
+    def test_instances_have_no_dict(self):
+        # attributes are stored in slots
+        assert Configuration.__dictoffset__ == 0
+        assert Configuration.__weakrefoffset__ == 0
+
     def test_mapping(self):
         config = Configuration({"foo": True})
 
@@ -40,10 +57,16 @@ class TestConfiguration:
         with pytest.raises(KeyError):
             print(config["a"])
 
+    def test_none_value_dictionary_notation(self):
+        config = Configuration({"a": None})
+
+        assert config["a"] is None
+        assert config.a is None
+
     def test_missing_file_error(self):
         config = Configuration()
 
-        filepath = pkg_resources.resource_filename(__name__, "./not_existing.foo")
+        filepath = get_file_path("not_existing.foo")
 
         assert not os.path.exists(filepath)
 
@@ -56,35 +79,51 @@ class TestConfiguration:
         with pytest.raises(FileNotFoundError):
             config.add_yaml_file(filepath)
 
-    def test_optional_ini_does_not_throw(self):
+    def test_missing_file_error_without_cache(self):
         config = Configuration()
 
-        not_existing_file = f"{uuid4()}.ini"
+        filepath = get_file_path("not_existing.foo")
+
+        with pytest.raises(FileNotFoundError):
+            config.add_ini_file(filepath, cache_config=False)
+
+        with pytest.raises(FileNotFoundError):
+            config.add_json_file(filepath, cache_config=False)
+
+        with pytest.raises(FileNotFoundError):
+            config.add_yaml_file(filepath, cache_config=False)
+
+        config.add_yaml_file(filepath, optional=True, cache_config=False)
+
+    def test_optional_ini_does_not_throw(self, missing_file_name):
+        config = Configuration()
+
+        not_existing_file = f"{missing_file_name}.ini"
 
         config.add_ini_file(not_existing_file, optional=True)
 
         assert True is True
 
-    def test_optional_json_does_not_throw(self):
+    def test_optional_json_does_not_throw(self, missing_file_name):
         config = Configuration()
 
-        not_existing_file = f"{uuid4()}.json"
+        not_existing_file = f"{missing_file_name}.json"
 
         config.add_json_file(not_existing_file, optional=True)
 
         assert True is True
 
-    def test_optional_yaml_does_not_throw(self):
+    def test_optional_yaml_does_not_throw(self, missing_file_name):
         config = Configuration()
 
-        not_existing_file = f"{uuid4()}.yaml"
+        not_existing_file = f"{missing_file_name}.yaml"
 
         config.add_yaml_file(not_existing_file, optional=True)
 
         assert True is True
 
     def test_yaml_can_use_full_loader(self):
-        filepath = pkg_resources.resource_filename(__name__, "./yaml_example_01.yaml")
+        filepath = get_file_path("yaml_example_01.yaml")
 
         config = Configuration()
         config.add_yaml_file(filepath, safe_load=False)
@@ -103,6 +142,14 @@ class TestConfiguration:
         assert config.foo is True
         assert config.hello == "world"
 
+    def test_mapping_keys_are_interned(self):
+        key = "".join(["hello", "_world"])
+        config = Configuration({key: 1, 2: "two"})
+
+        (stored_key,) = (k for k in config.values if k == "hello_world")
+        assert stored_key is sys.intern("hello_world")
+        assert config[2] == "two"
+
     def test_mapping_overriding(self):
         config = Configuration({"foo": True})
 
@@ -130,6 +177,146 @@ class TestConfiguration:
 
         assert config.x.y.z == 7
 
+    def test_nested_configuration_is_reused(self):
+        config = Configuration({"a": {"b": {"c": 1}}, "items": [{"id": "1"}]})
+
+        assert config.a is config.a
+        assert config.a.b is config.a.b
+        assert config.items is config.items
+
+        nested = config.a
+        config.add_value("a:b", 2)
+
+        assert config.a is not nested
+        assert config.a.b == 2
+
+    def test_frozen_configuration(self):
+        source = {"a": {"b": {"c": 1}}, "items": [{"id": "1"}, {"id": "2"}], "d": 2}
+        config = Configuration(source).freeze()
+
+        assert config.a.b.c == 1
+        assert config.items[1].id == "2"
+        assert config.d == 2
+        assert config["d"] == 2
+        assert config.e is None
+        assert config.to_dict() == source
+
+        with pytest.raises(KeyError):
+            config["e"]
+
+    @pytest.mark.parametrize(
+        "modify",
+        [
+            lambda config: config.add_value("a:b:c", 2),
+            lambda config: config.add_map({"d": 3}),
+            lambda config: config.add_environmental_variables(),
+            lambda config: config.a.b.add_value("c", 2),
+        ],
+    )
+    def test_frozen_configuration_cannot_be_modified(self, modify):
+        config = Configuration({"a": {"b": {"c": 1}}, "d": 2}).freeze()
+
+        with pytest.raises(ConfigurationError):
+            modify(config)
+
+        assert config.a.b.c == 1
+        assert config.d == 2
+
+    def test_nested_overriding_does_not_modify_source(self):
+        source = {"a": {"b": {"c": 1}, "d": 2}, "items": [{"id": "1"}]}
+        config = Configuration(source)
+
+        config.add_value("a:b:c", 3)
+        config.add_value("a:d", 4)
+        config.add_value("items:0:id", "2")
+
+        assert config.a.b.c == 3
+        assert config.a.d == 4
+        assert config.items[0].id == "2"
+        assert source == {"a": {"b": {"c": 1}, "d": 2}, "items": [{"id": "1"}]}
+
+        nested = config.to_dict()["a"]
+        config.add_value("a:b:c", 5)
+
+        # objects returned before are copied again, like the ones of merged mappings
+        assert config.a.b.c == 5
+        assert nested == {"b": {"c": 3}, "d": 4}
+
+    def test_nested_overriding_copies_objects_once(self, monkeypatch):
+        copies = []
+        copy_container = roconfiguration._copy_container
+
+        def spy(value):
+            copies.append(value)
+            return copy_container(value)
+
+        monkeypatch.setattr(roconfiguration, "_copy_container", spy)
+        source = {"a": {"b": {"c": 1, "d": 2}}}
+        config = Configuration(source)
+
+        config.add_value("a:b:c", 3)
+        assert len(copies) == 2
+
+        # objects copied by the configuration are modified without copying them
+        repr(config)
+        config.add_value("a:b:d", 4)
+        config.add_value("a:b:c", 5)
+        assert len(copies) == 2
+
+        # objects replaced by new values are not owned anymore
+        config.add_value("a:b", {"c": 6})
+        config.add_value("a:b:c", 7)
+        assert len(copies) == 3
+
+        assert config.a.b.c == 7
+        assert source == {"a": {"b": {"c": 1, "d": 2}}}
+
+    def test_single_level_overriding_of_owned_object(self, monkeypatch):
+        config = Configuration({"a": {"b": 1, "c": 2}})
+        config.add_value("a:b", 3)
+
+        walked = []
+        get_sub_property = roconfiguration._get_sub_property
+
+        def spy(*args):
+            walked.append(args)
+            return get_sub_property(*args)
+
+        monkeypatch.setattr(roconfiguration, "_get_sub_property", spy)
+
+        # the object copied by the first override is modified directly
+        config.add_value("a:b", 4)
+        config.add_value("a:c", 5)
+
+        assert walked == []
+        assert config.a.b == 4
+        assert config.a.c == 5
+
+    def test_nested_overriding_copies_read_only_mappings(self):
+        source = MappingProxyType({"b": {"c": 1}})
+        config = Configuration({"a": source})
+
+        config.add_value("a:b:c", 2)
+
+        assert config.values == {"a": {"b": {"c": 2}}}
+        assert source == {"b": {"c": 1}}
+
+    def test_nested_configuration_overriding_does_not_modify_parent(self):
+        config = Configuration({"a": {"b": {"c": 1}}, "items": [{"b": {"c": 1}}]})
+
+        nested = config.a
+        nested.add_value("b:c", 2)
+
+        assert nested.b.c == 2
+        assert config.a.b.c == 1
+        assert config.a is not nested
+
+        item = config.items[0]
+        item.add_value("b:c", 2)
+
+        assert item.b.c == 2
+        assert config.items[0].b.c == 1
+
     def test_reading_nested_list_values(self):
         config = Configuration(
             {"b2c": [{"tenant": "1"}, {"tenant": "2"}, {"tenant": "3"}]}
@@ -211,6 +398,16 @@ class TestConfiguration:
         with pytest.raises(KeyError):
             print(config["nope"])
 
+    def test_add_environmental_variables_with_filter_ignores_case(self):
+        os.environ["ROCONF_Hello"] = "World"
+        os.environ["ROCONF_Nested__Value"] = "1"
+
+        config = Configuration()
+        config.add_environmental_variables("roconf_", strip_prefix=True)
+
+        assert config.hello == "World"
+        assert config.nested.value == "1"
+
     def test_dictionary_notation(self):
         config = Configuration({"a": True})
 
@@ -240,6 +437,52 @@ class TestConfiguration:
 
         assert config.to_dict() == source
 
+    def test_override_nested_values_with_environmental_variables(self):
+        source = {
+            "db": {"host": "localhost", "port": 5432, "name": "example"},
+            "b2c": [{"tenant": "1"}, {"tenant": "2"}],
+        }
+        config = Configuration(source)
+
+        os.environ["ROCONF_DEEP_db__port"] = "5433"
+        os.environ["ROCONF_DEEP_b2c__1__tenant"] = "3"
+        os.environ["ROCONF_DEEP_db__host"] = "example.org"
+        os.environ["ROCONF_DEEP_db__options__timeout"] = "10"
+        os.environ["ROCONF_DEEP_b2c__0__tenant"] = "4"
+
+        config.add_environmental_variables("ROCONF_DEEP_", strip_prefix=True)
+
+        assert config.to_dict() == {
+            "db": {
+                "host": "example.org",
+                "port": "5433",
+                "name": "example",
+                "options": {"timeout": "10"},
+            },
+            "b2c": [{"tenant": "4"}, {"tenant": "3"}],
+        }
+
+    def test_shorter_environmental_variables_override_longer(self, monkeypatch):
+        monkeypatch.setenv("ROCONF_ORDER_X__Y", "1")
+        monkeypatch.setenv("ROCONF_ORDER_X__Y__Z", "2")
+        monkeypatch.setenv("ROCONF_ORDER_X__W__Z", "3")
+
+        config = Configuration()
+        config.add_environmental_variables("ROCONF_ORDER_", strip_prefix=True)
+
+        assert config.to_dict() == {"x": {"y": "1", "w": {"z": "3"}}}
+
+    def test_environmental_variables_without_nesting_override_longer(
+        self, monkeypatch
+    ):
+        monkeypatch.setenv("ROCONF_FLAT_X", "1")
+        monkeypatch.setenv("ROCONF_FLAT_X__Y", "2")
+
+        config = Configuration({"x": {"z": 3}})
+        config.add_environmental_variables("ROCONF_FLAT_", strip_prefix=True)
+
+        assert config.to_dict() == {"x": "1"}
+
     def test_override_with_environmental_variables(self):
         config = Configuration({"foo": 10, "ufo": 20})
 
@@ -258,6 +501,11 @@ class TestConfiguration:
 
         assert config.items == 200
 
+    @pytest.mark.parametrize("value", [[{"a": 1}], [], "x", 1])
+    def test_configuration_requires_mapping(self, value):
+        with raises(TypeError):
+            Configuration(value)
+
     def test_list_item_as_configuration(self):
         config = Configuration({"items": [{"id": "1"}, {"id": "2"}]})
 
@@ -265,6 +513,65 @@ class TestConfiguration:
         assert isinstance(first_item, Configuration)
         assert first_item.id == "1"
 
+    def test_list_items_are_wrapped_lazily(self):
+        config = Configuration({"items": [{"id": "1"}, {"id": "2"}, 3]})
+
+        items = config.items
+
+        assert len(items) == 3
+        assert items[0] is items[0]
+        assert items[-3] is items[0]
+        assert items[-1] == 3
+        assert [item.id for item in items[:2]] == ["1", "2"]
+        assert [3] == items[2:]
+        assert items == config.items
+
+        with pytest.raises(IndexError):
+            items[3]
+
+        with pytest.raises(IndexError):
+            items[-4]
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    def test_list_items_require_integer_indices(self, frozen):
+        config = Configuration({"items": [{"id": 1}, {"id": 2}]})
+        if frozen:
+            config.freeze()
+
+        assert config.items[True].id == 2
+
+        with pytest.raises(
+            TypeError, match="list indices must be integers or slices, not str"
+        ):
+            config.items["a"]
+
+    def test_frozen_list_items(self):
+        config = Configuration({"items": [{"id": "1"}, [{"id": "2"}]]}).freeze()
+
+        assert config.items[-2] is config.items[0]
+        assert config.items[1][0].id == "2"
+
+        with pytest.raises(ConfigurationError):
+            config.items[0].add_value("id", "3")
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    def test_list_of_scalars_is_list(self, frozen):
+        config = Configuration({"jwt_algorithms": ["HS256"], "nested": [["a"]]})
+        if frozen:
+            config.freeze()
+
+        assert isinstance(config.jwt_algorithms, list)
+        assert config.jwt_algorithms + ["RS256"] == ["HS256", "RS256"]
+        assert json.dumps(config.jwt_algorithms) == '["HS256"]'
+        assert isinstance(config.nested[0], list)
+        assert config.nested[0] + ["b"] == ["a", "b"]
+
+        # returned lists are copies, which can be modified
+        config.jwt_algorithms.append("RS256")
+        config.nested[0].append("b")
+        assert config.jwt_algorithms == ["HS256"]
+        assert config.nested[0] == ["a"]
+
     def test_list_of_values(self):
         config = Configuration({"items": [{"id": "1"}, {"id": "2"}]})
 
@@ -306,7 +613,7 @@ class TestConfiguration:
         assert config.another.forward_x11 == "no"
 
     def test_add_ini_file(self):
-        filepath = pkg_resources.resource_filename(__name__, "./ini_example_01.ini")
+        filepath = get_file_path("ini_example_01.ini")
 
         config = Configuration()
         config.add_ini_file(filepath)
@@ -317,7 +624,7 @@ class TestConfiguration:
         assert config.b.something == "world"
 
     def test_add_json_file(self):
-        filepath = pkg_resources.resource_filename(__name__, "./json_example_01.json")
+        filepath = get_file_path("json_example_01.json")
 
         config = Configuration()
         config.add_json_file(filepath)
@@ -332,6 +639,67 @@ class TestConfiguration:
         for b2c_conf in config.Authentication.B2C:
             assert b2c_conf.IssuerName.startswith("example")
 
+    def test_add_json_file_utf8(self, tmp_path):
+        filepath = tmp_path / "settings.json"
+        filepath.write_bytes('{"greeting": "cześć"}'.encode("utf-8"))
+
+        config = Configuration()
+        config.add_json_file(str(filepath), cache_config=False)
+
+        assert config.greeting == "cześć"
+
+    @pytest.mark.parametrize("json_module", ["json", "orjson"])
+    def test_add_json_file_with_each_parser(
+        self, json_module, json01_data, monkeypatch
+    ):
+        monkeypatch.setattr(
+            roconfiguration, "_json", pytest.importorskip(json_module)
+        )
+
+        config = Configuration()
+        config.add_json_file(
+            get_file_path("json_example_01.json"), cache_config=False
+        )
+
+        assert config.values == json01_data
+
+    @pytest.mark.parametrize("json_module", ["json", "orjson"])
+    def test_add_json_file_values_like_built_in_json(
+        self, json_module, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(
+            roconfiguration, "_json", pytest.importorskip(json_module)
+        )
+        filepath = tmp_path / "settings.json"
+        filepath.write_text(
+            '{"big": 123456789012345678901234567890, "small": -9223372036854775808,'
+            ' "nan": NaN, "inf": Infinity}'
+        )
+
+        config = Configuration()
+        config.add_json_file(str(filepath), cache_config=False)
+
+        assert config.big == 123456789012345678901234567890
+        assert config.small == -9223372036854775808
+        assert math.isnan(config.nan)
+        assert config.inf == math.inf
+
+    @pytest.mark.parametrize("json_module", ["json", "orjson"])
+    @pytest.mark.parametrize(
+        "document", ['{"a": 1,}', '{"a": 0001}', '{"a": 1.}', '{"a": "x\ty"}']
+    )
+    def test_add_json_file_invalid_document(
+        self, json_module, document, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(
+            roconfiguration, "_json", pytest.importorskip(json_module)
+        )
+        filepath = tmp_path / "settings.json"
+        filepath.write_text(document)
+
+        with raises(ValueError):
+            Configuration().add_json_file(str(filepath), cache_config=False)
+
     def test_contains(self):
         config = Configuration({"a": True})
 
@@ -339,7 +707,7 @@ class TestConfiguration:
         assert "b" not in config
 
     def test_add_yaml_file(self):
-        filepath = pkg_resources.resource_filename(__name__, "./yaml_example_01.yaml")
+        filepath = get_file_path("yaml_example_01.yaml")
 
         config = Configuration()
         config.add_yaml_file(filepath)
@@ -350,8 +718,56 @@ class TestConfiguration:
         assert config.jwt_audience == "https://example.org"
         assert config.jwt_algorithms == ["HS256"]
 
+    @pytest.mark.parametrize(
+        "method_name,file_name,fixture_name",
+        [
+            ("add_yaml_file", "yaml_example_01.yaml", "yaml01_data"),
+            ("add_yaml_file", "yaml_example_02.yaml", "yaml02_data"),
+            ("add_json_file", "json_example_01.json", "json01_data"),
+            ("add_ini_file", "ini_example_01.ini", "ini01_data"),
+        ],
+    )
+    def test_add_files_values(self, request, method_name, file_name, fixture_name):
+        config = Configuration()
+        getattr(config, method_name)(get_file_path(file_name))
+
+        assert config.to_dict() == request.getfixturevalue(fixture_name)
+
+    def test_configuration_from_parsed_yaml(self, yaml02_data):
+        config = Configuration(copy.deepcopy(yaml02_data))
+
+        config.add_value("services:encryption:key", "ANOTHER_KEY")
+
+        assert config.services.encryption.key == "ANOTHER_KEY"
+        assert yaml02_data["services"]["encryption"]["key"] == "SECRET_KEY"
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="LibYAML not available")
+    @pytest.mark.parametrize(
+        "safe_load,expected_loader",
+        [(True, "CSafeLoader"), (False, "CFullLoader")],
+    )
+    def test_yaml_uses_libyaml_loaders(self, safe_load, expected_loader, monkeypatch):
+        loaders = []
+        load = yaml.load
+
+        def spy_load(stream, Loader):
+            loaders.append(Loader)
+            return load(stream, Loader=Loader)
+
+        monkeypatch.setattr(yaml, "load", spy_load)
+
+        config = Configuration()
+        config.add_yaml_file(
+            get_file_path("yaml_example_01.yaml"),
+            safe_load=safe_load,
+            cache_config=False,
+        )
+
+        assert loaders == [getattr(yaml, expected_loader)]
+        assert config.port == 44555
+
     def test_add_yaml2_file(self):
-        filepath = pkg_resources.resource_filename(__name__, "./yaml_example_02.yaml")
+        filepath = get_file_path("yaml_example_02.yaml")
 
         config = Configuration()
         config.add_yaml_file(filepath)
@@ -362,6 +778,70 @@ class TestConfiguration:
         assert config.services.encryption.key == "SECRET_KEY"
         assert config.services.images.processor.type == "local"
 
+    def test_add_json_file_reuses_parsed_values(self):
+        filepath = get_file_path("json_example_01.json")
+
+        first = Configuration()
+        first.add_json_file(filepath, cache_config=True)
+        first.add_value("Logging:LogLevel:Default", "Debug")
+
+        second = Configuration()
+        second.add_json_file(filepath, cache_config=True)
+
+        assert first.Logging.LogLevel.Default == "Debug"
+        assert second.Logging.LogLevel.Default == "Warning"
+
+    def test_add_json_file_is_not_cached_by_default(self):
+        # parsing json is faster than deep copying cached values, see the note
+        # about the cache of parsed files in roconfiguration
+        Configuration.clear_file_cache()
+
+        Configuration().add_json_file(get_file_path("json_example_01.json"))
+
+        assert roconfiguration._load_json_cached.cache_info().currsize == 0
+
+    def test_add_yaml_file_parses_once_by_loader(self, tmp_path):
+        filepath = tmp_path / "settings.yaml"
+        filepath.write_text("foo: 1\n")
+
+        Configuration.clear_file_cache()
+
+        for _ in range(3):
+            Configuration().add_yaml_file(str(filepath))
+            Configuration().add_yaml_file(str(filepath), safe_load=False)
+
+        cache_info = roconfiguration._load_yaml_cached.cache_info()
+        assert cache_info.misses == 2
+        assert cache_info.hits == 4
+
+    def test_add_file_parses_again_modified_file(self, tmp_path):
+        filepath = tmp_path / "settings.yaml"
+        filepath.write_text("foo: 1\n")
+
+        config = Configuration()
+        config.add_yaml_file(str(filepath))
+
+        assert config.foo == 1
+
+        filepath.write_text("foo: 200\n")
+        st = filepath.stat()
+        os.utime(filepath, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        config.add_yaml_file(str(filepath))
+
+        assert config.foo == 200
+
+    def test_add_file_without_cache(self, tmp_path):
+        filepath = tmp_path / "settings.ini"
+        filepath.write_text("[a]\nport = 8080\n")
+
+        Configuration.clear_file_cache()
+        config = Configuration()
+        config.add_ini_file(str(filepath), cache_config=False)
+
+        assert config.a.port == "8080"
+        assert roconfiguration._load_ini_cached.cache_info().currsize == 0
+
     @pytest.mark.parametrize("keyword", [("for",), ("del",)])
     def test_keywords_handling(self, keyword):
         config = Configuration({keyword: 1})
@@ -382,6 +862,12 @@ class TestConfiguration:
             "Hello World",
             {"a": {"b": ["Hello World"]}},
         ),
+        ({}, "a__b:c", "Hello World", {"a": {"b": {"c": "Hello World"}}}),
+        ({}, "a___b", "Hello World", {"a": {"_b": "Hello World"}}),
+        ({}, "a:b__c", "Hello World", {"a": {"b": {"c": "Hello World"}}}),
+        # empty parts are kept as empty keys
+        ({}, "a:__b__", "Hello World", {"a": {"": {"b": "Hello World"}}}),
+        ({}, "a____b", "Hello World", {"a": {"": {"b": "Hello World"}}}),
     ],
 )
 def test_add_value(source, key, value, expected):
@@ -392,12 +878,29 @@ def test_add_value(source, key, value, expected):
     assert config.values == expected
 
 
+@pytest.mark.parametrize(
+    "source,key,value,expected",
+    [
+        ({"a": OrderedDict(b=1)}, "a:c", 2, {"a": {"b": 1, "c": 2}}),
+        ({"a": UserList([1, 2])}, "a:1", 3, {"a": [1, 3]}),
+        ({"a": UserList([{"b": 1}])}, "a:0:b", 2, {"a": [{"b": 2}]}),
+    ],
+)
+def test_add_value_to_other_collections(source, key, value, expected):
+    config = Configuration(source)
+
+    config.add_value(key, value)
+
+    assert config.values == expected
+
+
 @pytest.mark.parametrize(
     "source,key,value",
     [
         ({"a": []}, "a:0", "Hello World"),
         ({"a": ["Hello World"]}, "a:c", "Hello World"),
         ({"a": "Hello"}, "a:b:c", "Hello World"),
+        ({"a": [1, 2]}, "a:1:b:c", "Hello World"),
     ],
 )
 def test_apply_key_value_raises_for_invalid_overrides(source, key, value):
@@ -0,0 +1,5 @@
+import os
+
+
+def get_file_path(file_name: str) -> str:
+    return os.path.join(os.path.dirname(__file__), file_name)